@@ -1,7 +1,8 @@
 # utility functions to assist with the parsing of bytes
+import struct
 
 
-# returns an entire file as a byte array
+# returns an entire file as an immutable bytes object
 def get_file(filename):
     with open(filename, "rb") as f:
         a = f.read()
@@ -27,3 +28,21 @@ def parse_sib(sib):
 # convert an 1 byte int read from a byte array to a signed int
 def to_signed(byte_value: int):
     return (byte_value - 256) if byte_value > 127 else byte_value
+
+
+# lookup table of every byte value converted to a signed int, lets the decoder index instead of calling to_signed
+SIGNED_BYTES = [to_signed(byte_value) for byte_value in range(256)]
+
+
+# precompiled little endian readers, called as reader(buffer, offset)[0]. unlike int.from_bytes on a slice
+# these don't copy and they raise struct.error if the buffer is too short to hold the value
+UNPACK_U8 = struct.Struct("<B").unpack_from
+UNPACK_I8 = struct.Struct("<b").unpack_from
+UNPACK_U16 = struct.Struct("<H").unpack_from
+UNPACK_I16 = struct.Struct("<h").unpack_from
+UNPACK_U32 = struct.Struct("<I").unpack_from
+UNPACK_I32 = struct.Struct("<i").unpack_from
+
+# readers keyed by value size in bytes
+UNSIGNED_READERS = {1: UNPACK_U8, 2: UNPACK_U16, 4: UNPACK_U32}
+SIGNED_READERS = {1: UNPACK_I8, 2: UNPACK_I16, 4: UNPACK_I32}
@@ -1,16 +1,55 @@
 from instruction_data import (
     GLOBAL_INSTRUCTIONS_MAP,
     GLOBAL_REGISTER_NAMES,
-    REGADD_OPCODES,
+    DISPATCH,
+    RM_DIRECT,
+    RM_INDIRECT,
+    SIB_INDEX_BASE,
+    SIB_INDIRECT,
     InstructionInfo,
     ENCODINGS,
 )
-from byte_utils import parse_modrm, parse_sib, get_file, to_signed
-from typing import Tuple, Optional, Dict, List
+from byte_utils import (
+    get_file,
+    SIGNED_BYTES,
+    UNPACK_U32,
+)
+from typing import Tuple, Optional, Dict, List, Iterator
+from array import array
+import struct
+
+
+# maps each encoding to a function that formats an instruction of that encoding as a string. keyed by the enum's
+# int value since hashing an int is much cheaper than hashing an Enum member
+INSTRUCTION_FORMATTERS = {
+    ENCODINGS.M.value: lambda i: f"{i.mnemonic} {i.rm}",
+    ENCODINGS.MI.value: lambda i: f"{i.mnemonic} {i.rm}, {i.immediate}",
+    ENCODINGS.MR.value: lambda i: f"{i.mnemonic} {i.rm}, {i.reg}",
+    ENCODINGS.RM.value: lambda i: f"{i.mnemonic} {i.reg}, {i.rm}",
+    ENCODINGS.I.value: lambda i: f"{i.mnemonic} {i.immediate}",
+    ENCODINGS.O.value: lambda i: f"{i.mnemonic} {i.reg}",
+    ENCODINGS.OI.value: lambda i: f"{i.mnemonic} {i.reg}, {i.immediate}",
+    ENCODINGS.FD.value: lambda i: f"{i.mnemonic} {i.reg}, {i.immediate}",
+    ENCODINGS.TD.value: lambda i: f"{i.mnemonic} {i.immediate}, {i.reg}",
+    ENCODINGS.D.value: lambda i: f"{i.mnemonic} {i.immediate}",
+}
 
 
 # simple data class for building up a disassembled instruction with string tokens. as we deconstruct machine code we will build these up
 class Instruction:
+    # slots avoid a per instance __dict__ since we create one of these for every decoded instruction
+    __slots__ = (
+        "mnemonic",
+        "encoding",
+        "immediate",
+        "reg",
+        "rm",
+        "scale",
+        "index",
+        "base",
+        "is_db",
+    )
+
     def __init__(
         self,
         mnemonic=None,
@@ -40,71 +79,61 @@ class Instruction:
         if self.is_db:
             return f"db 0x{self.immediate:02X}"
 
-        # print instructions based on encoding
-        if self.encoding == ENCODINGS.M:
-            return f"{self.mnemonic} {self.rm}"
-        elif self.encoding == ENCODINGS.MI:
-            return f"{self.mnemonic} {self.rm}, {self.immediate}"
-        elif self.encoding == ENCODINGS.MR:
-            return f"{self.mnemonic} {self.rm}, {self.reg}"
-        elif self.encoding == ENCODINGS.RM:
-            return f"{self.mnemonic} {self.reg}, {self.rm}"
-        elif self.encoding == ENCODINGS.I:
-            return f"{self.mnemonic} {self.immediate}"
-        elif self.encoding == ENCODINGS.O:
-            return f"{self.mnemonic} {self.reg}"
-        elif self.encoding == ENCODINGS.OI:
-            return f"{self.mnemonic} {self.reg}, {self.immediate}"
-        elif self.encoding == ENCODINGS.FD:
-            return f"{self.mnemonic} {self.reg}, {self.immediate}"
-        elif self.encoding == ENCODINGS.TD:
-            return f"{self.mnemonic} {self.immediate}, {self.reg}"
-        elif self.encoding == ENCODINGS.D:
-            return f"{self.mnemonic} {self.immediate}"
-
-        else:  # ZO encoding
-            return self.mnemonic
-
-
-# get the mnemonic of a modrm instruction, handling opcode extension if needed
-def modrm_get_mnemonic(reg: int, instruction_info: InstructionInfo) -> str:
-
-    # check opcode extension if it exists to get the mnemonic based on reg
-    if instruction_info.extension_map and reg in instruction_info.extension_map:
-        return instruction_info.extension_map[reg]
-
-    # check if there is an illegal opcode extension
-    elif instruction_info.extension_map:
-        raise Exception(
-            f"Invalid opcode extension {reg} for opcode {instruction_info.opcode:X}"
-        )
+        # print instructions based on encoding, ZO instructions are just the mnemonic
+        formatter = INSTRUCTION_FORMATTERS.get(self.encoding._value_)
+        return formatter(self) if formatter else self.mnemonic
+
+
+# get the mnemonic of a modrm instruction, handling opcode extension if needed. returns None for an illegal extension
+def modrm_get_mnemonic(reg: int, instruction_info: InstructionInfo) -> Optional[str]:
+
+    # check opcode extension if it exists to get the mnemonic based on reg, this is None if it's illegal
+    if instruction_info.ext_lut:
+        return instruction_info.ext_lut[reg]
 
     # return mnemonic directly from the instruction info
     else:
         return instruction_info.mnemonic
 
 
-def modrm_get_addressing_mode(mod: int, instruction_info: InstructionInfo) -> int:
+# check that an addressing mode is allowed for an opcode. returns None for an illegal addressing mode
+def modrm_get_addressing_mode(
+    mod: int, instruction_info: InstructionInfo
+) -> Optional[int]:
     if mod in instruction_info.addressing_modes:
         return mod
     else:
-        raise Exception(
-            f"Invalid addressing mode {mod} for opcode {instruction_info.opcode:X}"
-        )
+        return None
 
 
 # disassemble instruction with modrm byte
-def modrm_disassemble(data: bytearray, opcode_size, instruction_info: InstructionInfo):
+def modrm_disassemble(
+    data: bytes,
+    offset: int,
+    opcode_size,
+    instruction_info: InstructionInfo,
+    reg_index: Optional[int],
+):
 
     # account for opcode size + modrm
     instruction_size = opcode_size + 1
 
-    # parse the modrm byte
-    (mod, reg, rm) = parse_modrm(data[0])
+    # index of the modrm byte, everything after the opcode is read relative to this
+    start = offset + opcode_size
+
+    # parse the modrm byte inline, this runs for every modrm instruction so it's worth skipping the call
+    modrm = data[start]
+    mod, reg, rm = modrm >> 6, (modrm >> 3) & 7, modrm & 7
+
+    # safely get the mnemonic and addressing mode, bail out if the opcode doesn't allow either
+    mnemonic = modrm_get_mnemonic(reg, instruction_info)
+    mod = modrm_get_addressing_mode(mod, instruction_info)
+    if mnemonic is None or mod is None:
+        return None
 
     # start building the instruction object
     instruction = Instruction(
-        mnemonic=modrm_get_mnemonic(reg, instruction_info),
+        mnemonic=mnemonic,
         encoding=instruction_info.encoding,
         reg=GLOBAL_REGISTER_NAMES[reg],
     )
@@ -113,105 +142,104 @@ def modrm_disassemble(data: bytearray, opcode_size, instruction_info: Instructio
     if instruction_info.opcode == 0xF7 and instruction.mnemonic == "test":
         instruction.encoding = ENCODINGS.MI
 
-    # safely get addressing mode
-    mod = modrm_get_addressing_mode(mod, instruction_info)
-
-    # continue building instruction based on addressing mode:
+    # continue building instruction based on addressing mode. the r/m operand is built up in a local and the
+    # modes are checked from most to least common: register direct, register indirect, then displacements
 
     # r/m is a direct register
     if mod == 3:
-        instruction.rm = GLOBAL_REGISTER_NAMES[rm]
+        rm_operand = RM_DIRECT[rm]
 
-    # r/m is register + dword displacement
-    elif mod == 2:
-        # sib byte detected
-        if rm == 4:
-            instruction_size += 5
-            displacement = int.from_bytes(data[2:6], "little", signed=False)
-            (scale, index, base) = parse_sib(data[1])
+    # mod is 0, check special cases
+    elif mod == 0:
+        # register only
+        if rm != 4 and rm != 5:
+            rm_operand = RM_INDIRECT[rm]
+
+        # sib byte
+        elif rm == 4:
+            instruction_size += 1
+            sib = data[start + 1]
+            index, base = (sib >> 3) & 7, sib & 7
+            # check for special cases of SIB byte at this spexifix mod
             # handle ESP
             if index == 4:
-                instruction.rm = f"[ dword {GLOBAL_REGISTER_NAMES[base]}"
+                rm_operand = RM_INDIRECT[base]
+            elif base == 5:
+                rm_operand = f"[ {GLOBAL_REGISTER_NAMES[index]}*{1 << (sib >> 6)}"
+                instruction_size += 4
+                displacement = UNPACK_U32(data, start + 2)[0]
+                if not displacement == 0:
+                    rm_operand += f" + 0x{displacement:08X}"
+
+                rm_operand += " ]"
+
             else:
-                instruction.rm = f"[ dword {GLOBAL_REGISTER_NAMES[index]}*{scale} + {GLOBAL_REGISTER_NAMES[base]}"
+                rm_operand = SIB_INDIRECT[sib]
+
+        # r/m is a displacement32
         else:
             instruction_size += 4
-            displacement = int.from_bytes(data[1:5], "little", signed=False)
-            instruction.rm = f"[ dword {GLOBAL_REGISTER_NAMES[rm]}"
-
-        if not displacement == 0:
-            instruction.rm += f" + 0x{displacement:08X}"
-
-        instruction.rm += " ]"
+            displacement = UNPACK_U32(data, start + 1)[0]
+            rm_operand = f"[ 0x{displacement:08X} ]"
 
     # rm is register + byte displacement
     elif mod == 1:
         # sib byte detected
         if rm == 4:
             instruction_size += 2
-            displacement = to_signed(data[2])
-            (scale, index, base) = parse_sib(data[1])
+            displacement = SIGNED_BYTES[data[start + 2]]
+            sib = data[start + 1]
+            index, base = (sib >> 3) & 7, sib & 7
             # handle ESP
             if index == 4:
-                instruction.rm = f"[ byte {GLOBAL_REGISTER_NAMES[base]}"
+                rm_operand = f"[ byte {GLOBAL_REGISTER_NAMES[base]}"
             else:
-                instruction.rm = f"[ byte {GLOBAL_REGISTER_NAMES[index]}*{scale} + {GLOBAL_REGISTER_NAMES[base]}"
+                rm_operand = f"[ byte {SIB_INDEX_BASE[sib]}"
         else:
             instruction_size += 1
-            displacement = to_signed(data[1])
-            instruction.rm = f"[ byte {GLOBAL_REGISTER_NAMES[rm]}"
+            displacement = SIGNED_BYTES[data[start + 1]]
+            rm_operand = f"[ byte {GLOBAL_REGISTER_NAMES[rm]}"
 
         if not displacement == 0:
-            instruction.rm += (
+            rm_operand += (
                 f" {"+" if displacement > 0 else "-"} 0x{abs(displacement):02X}"
             )
 
-        instruction.rm += " ]"
+        rm_operand += " ]"
 
-    # mod is 0, check special cases
+    # r/m is register + dword displacement
     else:
-        # r/m is a displacement32
-        if rm == 5:
-            instruction_size += 4
-            displacement = int.from_bytes(data[1:5], "little", signed=False)
-            instruction.rm = f"[ 0x{displacement:08X} ]"
-
-        # sib byte
-        elif rm == 4:
-            instruction_size += 1
-            (scale, index, base) = parse_sib(data[1])
-            # check for special cases of SIB byte at this spexifix mod
+        # sib byte detected
+        if rm == 4:
+            instruction_size += 5
+            displacement = UNPACK_U32(data, start + 2)[0]
+            sib = data[start + 1]
+            index, base = (sib >> 3) & 7, sib & 7
             # handle ESP
             if index == 4:
-                instruction.rm = f"[ {GLOBAL_REGISTER_NAMES[base]} ]"
-            elif base == 5:
-                instruction.rm = f"[ {GLOBAL_REGISTER_NAMES[index]}*{scale}"
-                instruction_size += 4
-                displacement = int.from_bytes(data[2:6], "little", signed=False)
-                if not displacement == 0:
-                    instruction.rm += f" + 0x{displacement:08X}"
+                rm_operand = f"[ dword {GLOBAL_REGISTER_NAMES[base]}"
+            else:
+                rm_operand = f"[ dword {SIB_INDEX_BASE[sib]}"
+        else:
+            instruction_size += 4
+            displacement = UNPACK_U32(data, start + 1)[0]
+            rm_operand = f"[ dword {GLOBAL_REGISTER_NAMES[rm]}"
 
-                instruction.rm += " ]"
+        if not displacement == 0:
+            rm_operand += f" + 0x{displacement:08X}"
 
-            else:
-                instruction.rm = f"[ {GLOBAL_REGISTER_NAMES[index]}*{scale} + {GLOBAL_REGISTER_NAMES[base]} ]"
+        rm_operand += " ]"
 
-        # register only
-        else:
-            instruction.rm = f"[ {GLOBAL_REGISTER_NAMES[rm]} ]"
+    instruction.rm = rm_operand
 
     # handle an immediate in the case of an MI instruction
     if instruction.encoding == ENCODINGS.MI:
 
-        instruction.immediate = int.from_bytes(
-            data[
-                instruction_size - 1 : instruction_size - 1 + instruction_info.imm_size
-            ],
-            "little",
-            signed=False,
+        # the immediate follows the modrm, sib and displacement bytes
+        imm_start = offset + instruction_size
+        instruction.immediate = instruction_info.imm_fmt.format(
+            instruction_info.imm_reader(data, imm_start)[0]
         )
-        if instruction_info.imm_size == 4:
-            instruction.immediate = f"0x{instruction.immediate:08X}"
 
         instruction_size += instruction_info.imm_size
 
@@ -220,10 +248,17 @@ def modrm_disassemble(data: bytearray, opcode_size, instruction_info: Instructio
 
 # disassemble instruction with no modrm byte or o/oi encoding
 def no_modrm_no_regadd_disassemble(
-    data, opcode_size, instruction_info: InstructionInfo, offset
+    data: bytes,
+    offset: int,
+    opcode_size,
+    instruction_info: InstructionInfo,
+    reg_index: Optional[int],
 ):
     # handle based on  encoding type
 
+    # index of the first byte after the opcode
+    start = offset + opcode_size
+
     instruction_size = opcode_size
     instruction = Instruction(
         mnemonic=instruction_info.mnemonic, encoding=instruction_info.encoding
@@ -242,42 +277,31 @@ def no_modrm_no_regadd_disassemble(
         # get the immediate size
         instruction_size += instruction_info.imm_size
 
-        # set the immediate based on the size
+        # read and format the immediate using the reader and format precomputed for this opcode
         if instruction.encoding == ENCODINGS.I:
-            imm_size = instruction_info.imm_size
-            if imm_size == 1:
-                # For 1-byte immediate, read as a signed integer
-                imm = int.from_bytes(data[:imm_size], byteorder="little", signed=True)
-                instruction.immediate = f"{imm}"
-            else:
-                # For 2 or 4-byte immediate, read as an unsigned integer
-                imm = int.from_bytes(data[:imm_size], byteorder="little", signed=False)
-                # Format the immediate value as a hexadecimal string with appropriate width
-                instruction.immediate = f"0x{imm:0{imm_size * 2}X}"
+            instruction.immediate = instruction_info.imm_fmt.format(
+                instruction_info.imm_reader(data, start)[0]
+            )
 
-        # encoding is D, indicating a relative offset
+        # encoding is D, FD or TD, the immediate is added to the offset of the next instruction
         else:
             instruction.immediate = (
-                int.from_bytes(data[: instruction_info.imm_size], "little", signed=True)
-                + offset
-                + instruction_size
+                instruction_info.imm_reader(data, start)[0] + offset + instruction_size
             )
 
     return instruction, instruction_size
 
 
-# check if an opcode cooresponds to one of the O/OI opcodes with something added
-def regadd_check_opcode(opcode):
-
-    for regadd_opcode in REGADD_OPCODES:
-        if (opcode - regadd_opcode >= 0) and (opcode - regadd_opcode < 8):
-            return GLOBAL_INSTRUCTIONS_MAP[regadd_opcode]
-    return None
-
-
-def regadd_disassemble(data, instruction_info: InstructionInfo):
+# disassemble an O/OI instruction, reg_index is the value that was added to the base opcode
+def regadd_disassemble(
+    data: bytes,
+    offset: int,
+    opcode_size,
+    instruction_info: InstructionInfo,
+    reg_index: int,
+):
 
-    if len(data) < 1:
+    if len(data) - offset < 1:
         raise ValueError("Insufficient data for disassembly.")
 
     # handle based on  encoding type
@@ -285,98 +309,151 @@ def regadd_disassemble(data, instruction_info: InstructionInfo):
     instruction = Instruction(
         mnemonic=instruction_info.mnemonic,
         encoding=instruction_info.encoding,
-        reg=GLOBAL_REGISTER_NAMES[data[0] - instruction_info.opcode],
+        reg=GLOBAL_REGISTER_NAMES[reg_index],
     )
 
     # check for immediate
     if instruction_info.encoding == ENCODINGS.OI:
         instruction_size += instruction_info.imm_size
-        imm = int.from_bytes(data[1:instruction_size], byteorder="little", signed=False)
-        instruction.immediate = f"0x{imm:08X}"
+        instruction.immediate = instruction_info.imm_fmt.format(
+            instruction_info.imm_reader(data, offset + 1)[0]
+        )
 
     return instruction, instruction_size
 
 
+# pick the function that decodes the operands of an opcode
+def select_decoder(instruction_info: InstructionInfo):
+
+    # handle instructions with the modrm byte
+    if instruction_info.has_modrm:
+        return modrm_disassemble
+
+    # handle o/oi instructions that require opcode math
+    elif (
+        instruction_info.encoding == ENCODINGS.O
+        or instruction_info.encoding == ENCODINGS.OI
+    ):
+        return regadd_disassemble
+
+    # handle all other instruction types
+    else:
+        return no_modrm_no_regadd_disassemble
+
+
+# resolve every opcode's decoder once at import so disassemble doesn't branch on it per instruction
+for opcode_info in GLOBAL_INSTRUCTIONS_MAP.values():
+    opcode_info.decoder = select_decoder(opcode_info)
+
+
+# figure out the opcode at an offset with a single dispatch lookup. returns the
+# (instruction info, opcode size, register index) entry for it, or None if it's not a valid opcode
+def get_dispatch_entry(
+    data: bytes, offset: int
+) -> Optional[Tuple[InstructionInfo, int, Optional[int]]]:
+    if len(data) - offset > 1:
+        return DISPATCH[data[offset] << 8 | data[offset + 1]]
+
+    # only one byte left, so a two byte opcode can't match
+    entry = DISPATCH[data[offset] << 8]
+    if entry and entry[1] == 2:
+        return None
+    return entry
+
+
 # disassemble a single instruction from a stream of binary data
 def disassemble(data: bytes, offset: int) -> Tuple["Instruction", int]:
 
     # first figure out the opcode and get a respective instruction data object
+    entry = get_dispatch_entry(data, offset)
 
-    # check for single byte opcode
-    if data[0] in GLOBAL_INSTRUCTIONS_MAP:
-        opcode_size = 1
-        instruction_info = GLOBAL_INSTRUCTIONS_MAP[data[0]]
+    # invalid opcode, return a db instruction
+    if entry is None:
+        return Instruction(immediate=data[offset], is_db=True), 1
 
-    # check for two byte opcode
-    elif int.from_bytes(data[:2], "big") in GLOBAL_INSTRUCTIONS_MAP:
-        opcode_size = 2
-        instruction_info = GLOBAL_INSTRUCTIONS_MAP[int.from_bytes(data[:2], "big")]
+    instruction_info, opcode_size, reg_index = entry
 
-    # check for opcode math (O/OI encodings)
-    elif regadd_check_opcode(data[0]):
-        instruction_info = regadd_check_opcode(data[0])
+    # try to disassemble using the decoder chosen for this opcode. reads past the end of the data raise, which
+    # only happens for an instruction cut off by the end of the file
+    try:
+        result = instruction_info.decoder(
+            data, offset, opcode_size, instruction_info, reg_index
+        )
+    except (IndexError, struct.error):
+        return Instruction(immediate=data[offset], is_db=True), 1
 
-    # invalid opcode, return a db instruction
-    else:
-        return Instruction(immediate=data[0], is_db=True), 1
+    # the decoder returns None for an invalid encoding, return a db instruction
+    if result is None:
+        return Instruction(immediate=data[offset], is_db=True), 1
 
-    # try to disassemble using the instruction info
-    try:
-        # handle instructions with the modrm byte
-        if instruction_info.has_modrm:
-            instruction, instruction_size = modrm_disassemble(
-                data[opcode_size:], opcode_size, instruction_info
-            )
+    return result
 
-        # handle o/oi instructions that require opcode math
-        elif (
-            instruction_info.encoding == ENCODINGS.O
-            or instruction_info.encoding == ENCODINGS.OI
-        ):
-            instruction, instruction_size = regadd_disassemble(data, instruction_info)
 
-        # handle all other instruction types
-        else:
-            instruction, instruction_size = no_modrm_no_regadd_disassemble(
-                data[opcode_size:], opcode_size, instruction_info, offset
-            )
+# linnear sweep over binary data already in memory. this is a generator yielding (offset, instruction, size) as
+# each instruction is decoded. relative jumps are yielded with their destination offset as the immediate
+def sweep_data(data: bytes) -> Iterator[Tuple[int, "Instruction", int]]:
+    counter = 0
+    while counter < len(data):
+        original_offset = counter
 
-        return instruction, instruction_size
+        # disassemble the instruction and get the instruction size
+        instruction, instruction_size = disassemble(data, original_offset)
 
-    except Exception as e:
-        return Instruction(immediate=data[0], is_db=True), 1
+        yield original_offset, instruction, instruction_size
 
+        # increment the counter by the size of the instruction
+        counter += instruction_size
 
-# linnear sweep algorithm for disassembly
-def linear_sweep(
-    filename: str,
-) -> Tuple[Dict[int, Tuple["Instruction", bytes]], Dict[int, str]]:
-    counter = 0
-    output_list = {}
-    labels = {}
 
-    # get the binary data from the file
+# read a file as bytes for sweeping. decoding reads it by offset so it is never copied, and it is kept as
+# immutable bytes since indexing bytes is faster than indexing a bytearray or memoryview
+def get_sweep_data(filename: str) -> bytes:
     data = get_file(filename)
+    if not isinstance(data, bytes):
+        data = bytes(data)
+    return data
 
-    while counter < len(data):
-        original_offset = counter
 
-        # disassemble the instruction and get the instruction size
-        instruction, instruction_size = disassemble(data[counter:], original_offset)
+# linnear sweep algorithm for disassembly, streams (offset, instruction, size) for every instruction in a file
+def linear_sweep(filename: str) -> Iterator[Tuple[int, "Instruction", int]]:
+    yield from sweep_data(get_sweep_data(filename))
+
+
+# run a full linnear sweep of a file and collect the results, returning the instructions and their sizes keyed
+# by offset, the labels for every jump destination, and the file data
+def sweep_to_dict(
+    filename: str,
+) -> Tuple[Dict[int, Tuple["Instruction", int]], Dict[int, str], bytes]:
+    output_list = {}
 
-        # generate a label for a relative jumping instruction
+    # offsets and destinations of relative jumps so their labels can be generated after the sweep
+    branch_offsets = array("q")
+    branch_destinations = array("q")
+
+    data = get_sweep_data(filename)
+    for offset, instruction, instruction_size in sweep_data(data):
+
+        # remember relative jumps, their immediate is the destination offset
         if instruction.encoding == ENCODINGS.D:
-            dest_addr = instruction.immediate  # save off the immediate
-            dest_addr_str = f"{dest_addr:08X}"  # get the immediate as a hex string
-            dest_label = f"offset_{dest_addr_str}h"  # generate offset label
-            labels[dest_addr] = dest_label  # insert into the labels dict
-            instruction.immediate = dest_label  # set the immediate to be the label name
+            branch_offsets.append(offset)
+            branch_destinations.append(instruction.immediate)
 
-        # store the instruction in the output list along with the raw bytes
-        instruction_bytes = data[original_offset : original_offset + instruction_size]
-        output_list[original_offset] = (instruction, instruction_bytes)
+        # store the instruction in the output list along with its size, the raw bytes can be recovered from the
+        # file data with raw_bytes so we don't keep a second copy of them
+        output_list[offset] = (instruction, instruction_size)
+
+    # generate a label for every jump destination, then replace each jump's immediate with its label name
+    labels = {
+        dest_addr: f"offset_{dest_addr:08X}h" for dest_addr in branch_destinations
+    }
+    for branch_offset, dest_addr in zip(branch_offsets, branch_destinations):
+        output_list[branch_offset][0].immediate = labels[dest_addr]
+
+    return output_list, labels, data
 
-        # increment the counter by the size of the instruction
-        counter += instruction_size
 
-    return output_list, labels
+# get the raw bytes of the instruction at an offset from the file data and the output of sweep_to_dict
+def raw_bytes(
+    data: bytes, output_list: Dict[int, Tuple["Instruction", int]], offset: int
+) -> memoryview:
+    return memoryview(data)[offset : offset + output_list[offset][1]]
@@ -1,4 +1,5 @@
 from enum import Enum
+from byte_utils import SIGNED_READERS, UNSIGNED_READERS
 
 
 # data class that stores information about an instruction. used over a list becuase fields are easier to keep track of than indicies
@@ -14,6 +15,8 @@ class InstructionInfo:
         opcode_plus=False,
         prefix_map=None,
         imm_size=4,
+        imm_signed=None,
+        imm_fmt=None,
     ) -> None:
         self.opcode = opcode  # opcode of the instruction
         self.mnemonic = mnemonic  # mnemonic of the instruction
@@ -21,9 +24,31 @@ class InstructionInfo:
         self.addressing_modes = addressing_modes  # allowed addressing modes for modrm
         self.encoding = encoding  # encoding/format type
         self.extension_map = extension_map  # opcode extension map if extension exists
+        # extension map flattened to a list indexed by reg, None marks an illegal extension
+        self.ext_lut = (
+            [extension_map.get(reg) for reg in range(8)] if extension_map else None
+        )
         self.opcode_plus = opcode_plus  # bool indicating whether we add to the opcode
         self.prefix_map = prefix_map  # map of prefixes for the instruction
         self.imm_size = imm_size  # immediate size
+        self.decoder = None  # function that decodes the operands, set by disassemble.py
+
+        # byte immediates are signed decimals, wider ones are unsigned hex padded to their width. D, FD and TD
+        # immediates are read signed and added to the offset of the next instruction, as the sweep always has
+        if imm_signed is None:
+            imm_signed = imm_size == 1 or encoding in (
+                ENCODINGS.D,
+                ENCODINGS.FD,
+                ENCODINGS.TD,
+            )
+        if imm_fmt is None:
+            imm_fmt = "{}" if imm_signed else f"0x{{:0{imm_size * 2}X}}"
+        self.imm_signed = imm_signed  # bool indicating whether the immediate is signed
+        self.imm_fmt = imm_fmt  # format string used to print the immediate
+
+        # reader for the immediate, picked once here so decoding doesn't branch on size or sign
+        readers = SIGNED_READERS if imm_signed else UNSIGNED_READERS
+        self.imm_reader = readers.get(imm_size)
 
 
 GLOBAL_REGISTER_NAMES = ["eax", "ecx", "edx", "ebx", "esp", "ebp", "esi", "edi"]
@@ -147,3 +172,41 @@ GLOBAL_INSTRUCTIONS_MAP = {
         0xF7, None, True, ENCODINGS.M, extension_map={0: "test", 2: "not", 7: "idiv"}
     ),
 }
+
+# 256 bit mask with a bit set for every first byte that is an O/OI opcode, i.e. a base in REGADD_OPCODES plus a
+# register index. every base is a multiple of 8, so the base is the byte & ~7 and the register index is the byte & 7
+REGADD_MASK = 0
+for regadd_opcode in REGADD_OPCODES:
+    # the byte & ~7 lookup only finds bases that are a multiple of 8
+    assert regadd_opcode & 7 == 0
+    REGADD_MASK |= 0xFF << regadd_opcode
+
+# flat dispatch table indexed by the first two bytes of an instruction, (byte0 << 8) | byte1. each slot holds
+# (instruction info, opcode size, register index or None) so that decoding an opcode is a single list index
+DISPATCH = [None] * 65536
+for first_byte in range(256):
+    if (REGADD_MASK >> first_byte) & 1:
+        entry = (GLOBAL_INSTRUCTIONS_MAP[first_byte & ~7], 1, first_byte & 7)
+    elif first_byte in GLOBAL_INSTRUCTIONS_MAP:
+        entry = (GLOBAL_INSTRUCTIONS_MAP[first_byte], 1, None)
+    else:
+        continue
+    for second_byte in range(256):
+        DISPATCH[first_byte << 8 | second_byte] = entry
+
+# two byte opcodes only occupy their exact slot
+for opcode, instruction_info in GLOBAL_INSTRUCTIONS_MAP.items():
+    if opcode > 0xFF:
+        DISPATCH[opcode] = (instruction_info, 2, None)
+
+# precomputed r/m operand strings so the modrm decoder can index them instead of formatting every instruction.
+# RM_DIRECT is a register operand (mod 3) and RM_INDIRECT is a plain register dereference (mod 0)
+RM_DIRECT = GLOBAL_REGISTER_NAMES
+RM_INDIRECT = [f"[ {register} ]" for register in GLOBAL_REGISTER_NAMES]
+
+# "index*scale + base" for every sib byte, indexed by the sib byte itself
+SIB_INDEX_BASE = [
+    f"{GLOBAL_REGISTER_NAMES[(sib >> 3) & 7]}*{2 ** (sib >> 6)} + {GLOBAL_REGISTER_NAMES[sib & 7]}"
+    for sib in range(256)
+]
+SIB_INDIRECT = [f"[ {index_base} ]" for index_base in SIB_INDEX_BASE]
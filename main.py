@@ -1,5 +1,23 @@
 import argparse
-from disassemble import linear_sweep
+from disassemble import sweep_to_dict, raw_bytes
+
+
+# format the output of sweep_to_dict as lines of disassembly, yielding a label line before any instruction that
+# is a jump destination
+def format_output(output_list, labels, data):
+
+    # start by getting the offsets in sorted order
+    for offset in sorted(output_list.keys()):
+
+        # check if a label exists at this offset and yield it first
+        if offset in labels:
+            yield f"{labels[offset]}:"
+
+        # format the raw instruction bytes
+        instruction_bytes = raw_bytes(data, output_list, offset).hex().upper()
+
+        # yield the offset, instruction bytes, and finally the instruction
+        yield f"{offset:08X}: {instruction_bytes:24} {output_list[offset][0]}"
 
 
 # main function and entry point into program
@@ -16,23 +34,14 @@ def main():
 
     # try to disassemble the program and print any errors that occur
     try:
-        output_list, labels = linear_sweep(input_file)
+        output_list, labels, data = sweep_to_dict(input_file)
     except Exception as e:
         print(f"Error: {e}")
         exit(1)
 
-    # Print disassembly, start by getting the offsets in sorted order
-    for offset in sorted(output_list.keys()):
-
-        # check if a label exists at this offset and print it first
-        if offset in labels:
-            print(f"{labels[offset]}:")
-
-        # format the raw instruction bytes
-        instruction_bytes = "".join(f"{byte:02X}" for byte in output_list[offset][1])
-
-        # print the offset, instruction bytes, and finally the instruction
-        print(f"{offset:08X}: {instruction_bytes:24} {output_list[offset][0]}")
+    # Print disassembly
+    for line in format_output(output_list, labels, data):
+        print(line)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,92 @@
+import argparse
+import cProfile
+import os
+import pstats
+import sys
+from collections import Counter
+
+# make the disassembler modules importable when this is run as tools/profile_sweep.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from disassemble import sweep_to_dict
+from main import format_output
+
+
+# functions whose cumulative time is reported for each phase of a run
+PHASES = {
+    "io": ["get_file"],
+    "decode": ["disassemble"],
+    "format": ["format_output"],
+}
+
+# decoders that disassemble dispatches to, reported with their call counts
+DECODERS = [
+    "modrm_disassemble",
+    "regadd_disassemble",
+    "no_modrm_no_regadd_disassemble",
+]
+
+
+# disassemble a file and format every line of output with main's formatter. the lines are only built so that
+# formatting shows up in the profile, nothing is printed
+def sweep_and_format(filename):
+    output_list, labels, data = sweep_to_dict(filename)
+    for _ in format_output(output_list, labels, data):
+        pass
+    return output_list
+
+
+# sum the (call count, cumulative time) of every profiled function with one of the given names
+def function_totals(stats, names):
+    calls = 0
+    cumulative = 0.0
+    for (_, _, function_name), (_, ncalls, _, ctime, _) in stats.stats.items():
+        if function_name in names:
+            calls += ncalls
+            cumulative += ctime
+    return calls, cumulative
+
+
+# main function and entry point into the profiler
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-i", "--input", help="binary file to disassemble", required=True
+    )
+    parser.add_argument(
+        "-n", "--top", help="number of functions to list", type=int, default=20
+    )
+    args = vars(parser.parse_args())
+
+    # profile a full sweep plus formatting of the output
+    profiler = cProfile.Profile()
+    output_list = profiler.runcall(sweep_and_format, args["input"])
+    stats = pstats.Stats(profiler)
+
+    # top functions by cumulative time
+    stats.sort_stats("cumulative").print_stats(args["top"])
+
+    # time spent in each phase, these can overlap if a phase calls into another
+    print("time by phase:")
+    for phase, names in PHASES.items():
+        calls, cumulative = function_totals(stats, names)
+        print(f"  {phase:8} {cumulative:10.3f}s {calls:10} calls")
+
+    # how often each decoder ran
+    print("decoder calls:")
+    for name in DECODERS:
+        calls, cumulative = function_totals(stats, [name])
+        print(f"  {name:32} {calls:10} calls {cumulative:10.3f}s")
+
+    # how many instructions of each encoding were decoded
+    encodings = Counter(
+        "db" if instruction.is_db else instruction.encoding.name
+        for instruction, _ in output_list.values()
+    )
+    print("instructions by encoding:")
+    for encoding, count in encodings.most_common():
+        print(f"  {encoding:8} {count:10}")
+
+
+if __name__ == "__main__":
+    main()